@@ -3,50 +3,82 @@ import sqlite3
 class TaskDatabase:
     def __init__(self, db_file):
         self.connection = sqlite3.connect(db_file)
+        # One cursor is reused by every query instead of allocating one per call
+        self.cursor = self.connection.cursor()
+        self.set_pragmas()
         self.create_tables()
 
+    def set_pragmas(self):
+        # WAL with synchronous=NORMAL avoids a full fsync on every commit,
+        # which dominates the cost of each add/complete/delete
+        self.cursor.execute('PRAGMA journal_mode = WAL')
+        self.cursor.execute('PRAGMA synchronous = NORMAL')
+        self.cursor.execute('PRAGMA temp_store = MEMORY')
+        self.cursor.execute('PRAGMA cache_size = -20000')
+        self.cursor.execute('PRAGMA mmap_size = 268435456')
+
     def create_tables(self):
-        cursor = self.connection.cursor()
-        cursor.execute('''
+        self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY,
                 description TEXT NOT NULL,
                 completed INTEGER DEFAULT 0
             )
         ''')
+        # Both list queries filter on completed and read rows in id order
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed)
+        ''')
         self.connection.commit()
 
     def insert_task(self, description):
-        cursor = self.connection.cursor()
-        cursor.execute('''
+        self.cursor.execute('''
             INSERT INTO tasks (description) VALUES (?)
         ''', (description,))
         self.connection.commit()
+        return self.cursor.lastrowid
+
+    def insert_tasks(self, descriptions):
+        # Insert many tasks in a single transaction (one commit instead of N)
+        self.cursor.executemany('''
+            INSERT INTO tasks (description) VALUES (?)
+        ''', ((description,) for description in descriptions))
+        self.connection.commit()
+        return self.cursor.rowcount
 
     def get_all_tasks(self):
-        cursor = self.connection.cursor()
-        cursor.execute('''
-            SELECT id, description FROM tasks WHERE completed = 0
+        self.cursor.execute('''
+            SELECT id, description FROM tasks WHERE completed = 0 ORDER BY id
         ''')
-        return cursor.fetchall()
+        return self.cursor.fetchall()
 
     def get_completed_tasks(self):
-        cursor = self.connection.cursor()
-        cursor.execute('''
-            SELECT id, description FROM tasks WHERE completed = 1
+        self.cursor.execute('''
+            SELECT id, description FROM tasks WHERE completed = 1 ORDER BY id
         ''')
-        return cursor.fetchall()
+        return self.cursor.fetchall()
+
+    def get_tasks_page(self, after_id=0, limit=200):
+        # Keyset pagination: seek past the last loaded id instead of OFFSET
+        self.cursor.execute('''
+            SELECT id, description FROM tasks WHERE completed = 0 AND id > ? ORDER BY id LIMIT ?
+        ''', (after_id, limit))
+        return self.cursor.fetchall()
+
+    def get_completed_tasks_page(self, after_id=0, limit=200):
+        self.cursor.execute('''
+            SELECT id, description FROM tasks WHERE completed = 1 AND id > ? ORDER BY id LIMIT ?
+        ''', (after_id, limit))
+        return self.cursor.fetchall()
 
     def mark_task_complete(self, task_id):
-        cursor = self.connection.cursor()
-        cursor.execute('''
+        self.cursor.execute('''
             UPDATE tasks SET completed = 1 WHERE id = ?
         ''', (task_id,))
         self.connection.commit()
 
     def delete_task(self, task_id):
-        cursor = self.connection.cursor()
-        cursor.execute('''
+        self.cursor.execute('''
             DELETE FROM tasks WHERE id = ?
         ''', (task_id,))
         self.connection.commit()
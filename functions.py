@@ -1,13 +1,29 @@
 import tkinter as tk
 from tkinter import simpledialog
 
+LISTBOX_INSERT_CHUNK = 1000
+
 def populate_listbox(listbox, data):
-    for item in data:
-        listbox.insert(tk.END, item)
+    # Insert in chunks: one Tcl call per chunk instead of one per item
+    data = list(data)
+    for start in range(0, len(data), LISTBOX_INSERT_CHUNK):
+        listbox.insert(tk.END, *data[start:start + LISTBOX_INSERT_CHUNK])
+
+def load_listbox_page(listbox, task_ids, fetch_page, limit):
+    # Append the rows that follow the last loaded id; returns whether more may follow
+    after_id = task_ids[-1] if task_ids else 0
+    tasks = fetch_page(after_id, limit)
+    task_ids.extend(task_id for task_id, description in tasks)
+    populate_listbox(listbox, [description for task_id, description in tasks])
+    return len(tasks) == limit
 
 def create_button(parent, text, command):
     button = tk.Button(parent, text=text, command=command)
     button.pack(side=tk.LEFT, padx=20)
+    # Keep a text -> button map so lookups don't walk the children via Tcl
+    if not hasattr(parent, "button_registry"):
+        parent.button_registry = {}
+    parent.button_registry[text] = button
 
 def get_selected_tab(notebook):
     return notebook.tab(notebook.select(), "text")
@@ -36,7 +52,7 @@ def move_task(source_listbox, source_data, task, dest_listbox, dest_data):
     source_index = source_listbox.curselection()
     if source_index:
         source_listbox.delete(source_index)
-        source_data.remove(task)
+        source_data.pop(source_index[0])
         dest_data.append(task)
         dest_listbox.insert(tk.END, task)
 
@@ -44,7 +60,7 @@ def delete_task_from_listbox(listbox, data_list, task):
     selected_index = listbox.curselection()
     if selected_index:
         listbox.delete(selected_index)
-        del data_list[selected_index[0]]
+        data_list.pop(selected_index[0])
 
 def hide_button(parent, button_text):
     button = get_button_by_text(parent, button_text)
@@ -65,6 +81,4 @@ def show_buttons(parent, button_texts):
         show_button(parent, button_text)
 
 def get_button_by_text(parent, button_text):
-    for child in parent.winfo_children():
-        if isinstance(child, tk.Button) and child.cget("text") == button_text:
-            return child
+    return getattr(parent, "button_registry", {}).get(button_text)
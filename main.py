@@ -1,7 +1,8 @@
-import tkinter as tk
-from task_manager import TaskManagerApp
-
 def main():
+    # Import the GUI lazily so importing this module doesn't pull in tkinter
+    import tkinter as tk
+    from task_manager import TaskManagerApp
+
     db_file = 'tasks.db'
     root = tk.Tk()
     app = TaskManagerApp(root, db_file)
@@ -3,6 +3,8 @@ from tkinter import ttk
 import functions as func
 from database import TaskDatabase
 
+PAGE_SIZE = 200  # rows fetched per page as the listboxes are scrolled
+
 class TaskManagerApp:
     def __init__(self, root, db_file):
         self.root = root
@@ -17,19 +19,25 @@ class TaskManagerApp:
         self.task_tab = tk.Frame(self.notebook)
         self.notebook.add(self.task_tab, text="Tasks")
         
-        self.task_listbox = tk.Listbox(self.task_tab, width=70, height=20)
+        self.task_listbox = tk.Listbox(self.task_tab, width=70, height=20,
+                                       yscrollcommand=self.on_task_scroll)
         self.task_listbox.pack()
         
         # Create completed task listbox in the "Completed Tasks" tab
         self.completed_task_tab = tk.Frame(self.notebook)
         self.notebook.add(self.completed_task_tab, text="Completed Tasks")
         
-        self.completed_task_listbox = tk.Listbox(self.completed_task_tab, width=70, height=20)
+        self.completed_task_listbox = tk.Listbox(self.completed_task_tab, width=70, height=20,
+                                                 yscrollcommand=self.on_completed_task_scroll)
         self.completed_task_listbox.pack()
         
-        # Populate task listbox with existing tasks from database
+        # Populate task listbox with the first page of tasks from database;
+        # the completed list is loaded the first time its tab is shown
+        self.task_ids = []
+        self.completed_task_ids = []
         self.refresh_task_listbox()
-        self.refresh_completed_task_listbox()
+        self.more_completed_tasks = False
+        self.completed_tasks_dirty = True
         
         # Create buttons for task operations
         self.buttons_frame = tk.Frame(self.root)
@@ -45,55 +53,71 @@ class TaskManagerApp:
     def on_tab_change(self, event):
         selected_tab = func.get_selected_tab(self.notebook)
         func.handle_tab_change(selected_tab, self.buttons_frame)
+        # The completed list is only rebuilt when it is shown after a change
+        if selected_tab == "Completed Tasks" and self.completed_tasks_dirty:
+            self.refresh_completed_task_listbox()
+            self.completed_tasks_dirty = False
 
     def refresh_task_listbox(self):
+        # Reload as many rows as were already shown so the view doesn't jump back
+        limit = max(PAGE_SIZE, len(self.task_ids))
         self.task_listbox.delete(0, tk.END)
-        tasks = self.db.get_all_tasks()
-        for task_id, description in tasks:
-            self.task_listbox.insert(tk.END, description)
+        self.task_ids = []
+        self.more_tasks = func.load_listbox_page(self.task_listbox, self.task_ids,
+                                                 self.db.get_tasks_page, limit)
 
     def refresh_completed_task_listbox(self):
+        limit = max(PAGE_SIZE, len(self.completed_task_ids))
         self.completed_task_listbox.delete(0, tk.END)
-        tasks = self.db.get_completed_tasks()
-        for task_id, description in tasks:
-            self.completed_task_listbox.insert(tk.END, description)
+        self.completed_task_ids = []
+        self.more_completed_tasks = func.load_listbox_page(self.completed_task_listbox, self.completed_task_ids,
+                                                           self.db.get_completed_tasks_page, limit)
+
+    def on_task_scroll(self, first, last):
+        # Fetch the next page once the bottom of the loaded rows comes into view
+        if self.more_tasks and float(last) >= 1.0:
+            self.more_tasks = func.load_listbox_page(self.task_listbox, self.task_ids,
+                                                     self.db.get_tasks_page, PAGE_SIZE)
+
+    def on_completed_task_scroll(self, first, last):
+        if self.more_completed_tasks and float(last) >= 1.0:
+            self.more_completed_tasks = func.load_listbox_page(self.completed_task_listbox, self.completed_task_ids,
+                                                               self.db.get_completed_tasks_page, PAGE_SIZE)
 
     def add_task(self):
         new_task = func.get_user_input(self.root, "Add Task", "Enter new task:")
         if new_task:
-            self.db.insert_task(new_task)
-            self.refresh_task_listbox()
+            task_id = self.db.insert_task(new_task)
+            # Update the listbox in place; if later pages aren't loaded yet the
+            # new task (highest id) will arrive with the last page instead
+            if not self.more_tasks:
+                self.task_ids.append(task_id)
+                self.task_listbox.insert(tk.END, new_task)
 
     def mark_complete(self):
-        selected_task = func.get_selected_task(self.task_listbox)
-        if selected_task:
-            task_id = self.get_task_id(selected_task, self.task_listbox)
-            if task_id:
-                self.db.mark_task_complete(task_id)
-                self.refresh_task_listbox()
-                self.refresh_completed_task_listbox()
+        task_id = self.get_task_id(self.task_listbox, self.task_ids)
+        if task_id:
+            self.db.mark_task_complete(task_id)
+            func.delete_task_from_listbox(self.task_listbox, self.task_ids, task_id)
+            self.completed_tasks_dirty = True
 
     def delete_task(self):
-        selected_task = func.get_selected_task(self.task_listbox)
-        if selected_task:
-            task_id = self.get_task_id(selected_task, self.task_listbox)
-            if task_id:
-                self.db.delete_task(task_id)
-                self.refresh_task_listbox()
+        task_id = self.get_task_id(self.task_listbox, self.task_ids)
+        if task_id:
+            self.db.delete_task(task_id)
+            func.delete_task_from_listbox(self.task_listbox, self.task_ids, task_id)
 
     def delete_completed_task(self):
-        selected_task = func.get_selected_task(self.completed_task_listbox)
-        if selected_task:
-            task_id = self.get_task_id(selected_task, self.completed_task_listbox)
-            if task_id:
-                self.db.delete_task(task_id)
-                self.refresh_completed_task_listbox()
+        task_id = self.get_task_id(self.completed_task_listbox, self.completed_task_ids)
+        if task_id:
+            self.db.delete_task(task_id)
+            func.delete_task_from_listbox(self.completed_task_listbox, self.completed_task_ids, task_id)
 
-    def get_task_id(self, task_description, listbox):
-        tasks = listbox.get(0, tk.END)
-        for index, description in enumerate(tasks):
-            if description == task_description:
-                return index + 1  # SQLite uses 1-based index for IDs
+    def get_task_id(self, listbox, task_ids):
+        # task_ids holds the database id of each listbox row, in display order
+        selected_index = listbox.curselection()
+        if selected_index:
+            return task_ids[selected_index[0]]
 
     def close(self):
         self.db.close()